@@ -3,151 +3,214 @@ Fuzzy Logic Controller for Fire Suppression System
 Handles all fuzzy logic calculations and membership functions
 """
 
+import bisect
+import functools
+from dataclasses import dataclass, field
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; without it the evaluation core runs as plain Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True)
+def _triangular_eval(x, lo, hi, a, b, c, mu):
+    """Scalar triangular membership evaluation into mu, input clipped to [lo, hi]"""
+    x = min(max(x, lo), hi)
+    for i in range(a.shape[0]):
+        value = min((x - a[i]) / (b[i] - a[i]), (c[i] - x) / (c[i] - b[i]))
+        mu[i] = min(max(value, 0.0), 1.0)
+
+
+@njit(cache=True)
+def _fuzzy_eval(temp, duration, heat_range, heat_a, heat_b, heat_c,
+                dur_range, dur_a, dur_b, dur_c, rule_heat, rule_dur, rule_out,
+                h_mu, d_mu):
+    """
+    Compiled fuzzy pipeline for a single (temperature, duration) pair
+    
+    Memberships are written into the caller-provided h_mu and d_mu buffers.
+    
+    Returns:
+        tuple: (water_output, dominant heat index, dominant duration index,
+                heat memberships, duration memberships)
+    """
+    _triangular_eval(temp, heat_range[0], heat_range[1], heat_a, heat_b, heat_c, h_mu)
+    _triangular_eval(duration, dur_range[0], dur_range[1], dur_a, dur_b, dur_c, d_mu)
+    
+    numerator = 0.0
+    denominator = 0.0
+    for i in range(rule_out.shape[0]):
+        strength = min(h_mu[rule_heat[i]], d_mu[rule_dur[i]])
+        numerator += strength * rule_out[i]
+        denominator += strength
+    water_output = numerator / denominator if denominator > 0 else 0.0
+    
+    return water_output, np.argmax(h_mu), np.argmax(d_mu), h_mu, d_mu
+
+
+def _param_array(*values, dtype=np.float64):
+    """Dataclass field defaulting to a fresh array of the given constants"""
+    return field(default_factory=lambda: np.array(values, dtype=dtype))
+
+
+@dataclass(slots=True, eq=False)
 class FuzzyLogicController:
-    def __init__(self):
-        """Initialize the fuzzy logic controller"""
-        pass
+    """
+    Fuzzy controller holding its membership parameters and rule base
+    
+    All parameter arrays are shared by the scalar, JIT-compiled and batched
+    evaluation paths. Treat them as read-only after construction, since
+    scalar responses are cached per controller.
+    """
+    # Fuzzy set names, in the positional order used by the membership arrays
+    HEAT_NAMES = ('low', 'medium', 'high', 'critical')
+    DURATION_NAMES = ('short', 'medium', 'long')
+
+    # Lookup tables for the response tail: status is indexed by
+    # 0 = standby, 1 = warning (>= 140°F), 2 = triggered, and water level by
+    # 0 = no output, otherwise 1 + number of thresholds reached
+    STATUS_TABLE = (('STANDBY', '#4ecdc4'), ('WARNING', '#ffa726'), ('ACTIVE', '#ff4444'))
+    WATER_LEVELS = ('None', 'Low', 'Medium', 'High')
+    WATER_LEVEL_THRESHOLDS = (0.3, 0.7)
+
+    # Triangular membership parameters (left foot, peak, right foot).
+    # Shoulder sets put their peak on the edge of the input range, and inputs
+    # are clipped to that range so the shoulders stay at full membership.
+    heat_range: tuple = (70.0, 300.0)
+    heat_a: np.ndarray = _param_array(20.0, 100.0, 150.0, 200.0)
+    heat_b: np.ndarray = _param_array(70.0, 140.0, 185.0, 300.0)
+    heat_c: np.ndarray = _param_array(120.0, 180.0, 220.0, 400.0)
+
+    duration_range: tuple = (0.0, 60.0)
+    duration_a: np.ndarray = _param_array(-15.0, 10.0, 25.0)
+    duration_b: np.ndarray = _param_array(0.0, 22.5, 60.0)
+    duration_c: np.ndarray = _param_array(15.0, 35.0, 95.0)
+
+    # Rule base stored as parallel arrays: rule i fires with strength
+    # min(heat[rule_heat[i]], duration[rule_dur[i]]) towards rule_out[i]
+    rule_heat: np.ndarray = _param_array(
+        0, 0, 0,    # Rule 1: Low heat, any duration = No water
+        1, 1, 1,    # Rule 2: Medium heat = Low to medium water
+        2, 2, 2,    # Rule 3: High heat = Medium to high water
+        3, 3, 3,    # Rule 4: Critical heat = Maximum water
+        dtype=np.int64
+    )
+    rule_dur: np.ndarray = _param_array(0, 1, 2, 0, 1, 2, 0, 1, 2, 0, 1, 2, dtype=np.int64)
+    rule_out: np.ndarray = _param_array(
+        0.0, 0.0, 0.0,
+        0.2, 0.4, 0.6,
+        0.6, 0.8, 1.0,
+        0.8, 1.0, 1.0,
+    )
+
+    _cached_response: object = field(init=False, repr=False)
+    _heat_buf: np.ndarray = field(init=False, repr=False)
+    _dur_buf: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Set up the response cache and scalar evaluation buffers"""
+        # Slider drags repeat the same few inputs, so responses are memoized
+        # per controller on the quantized (heat, duration) pair
+        self._cached_response = functools.lru_cache(maxsize=2048)(self._compute_response)
+        
+        # Reused output buffers for scalar membership evaluation
+        self._heat_buf = np.zeros(len(self.HEAT_NAMES))
+        self._dur_buf = np.zeros(len(self.DURATION_NAMES))
+    
+    @staticmethod
+    def _triangular_membership(x, a, b, c, out=None):
+        """
+        Evaluate triangular membership functions for scalar or array input
+        
+        Args:
+            x (float or ndarray): Crisp input value(s)
+            a, b, c (ndarray): Left foot, peak and right foot of each set
+            out (ndarray, optional): Buffer to write the result into
+            
+        Returns:
+            ndarray: Membership values, one column per fuzzy set
+        """
+        x = np.asarray(x, dtype=np.float64)[..., np.newaxis]
+        rising = (x - a) / (b - a)
+        falling = (c - x) / (c - b)
+        out = np.minimum(rising, falling, out=out)
+        return np.clip(out, 0.0, 1.0, out=out)
     
     def get_heat_membership(self, temp):
         """
         Calculate membership values for heat level fuzzy sets
         
         Args:
-            temp (float): Temperature in Fahrenheit
+            temp (float or ndarray): Temperature in Fahrenheit
             
         Returns:
-            dict: Membership values for each heat level category
+            ndarray: Membership values ordered as HEAT_NAMES
+                     (low: 70-120°F, medium: 100-180°F,
+                      high: 150-220°F, critical: 200°F+).
+                     For scalar input this is a shared buffer that the
+                     next scalar call overwrites.
         """
-        memberships = {
-            'low': 0,
-            'medium': 0,
-            'high': 0,
-            'critical': 0
-        }
-        
-        # Low: 70-120°F
-        if temp <= 120:
-            memberships['low'] = max(0, (120 - temp) / 50)
-        
-        # Medium: 100-180°F
-        if 100 <= temp <= 180:
-            if temp <= 140:
-                memberships['medium'] = (temp - 100) / 40
-            else:
-                memberships['medium'] = (180 - temp) / 40
-        
-        # High: 150-220°F
-        if 150 <= temp <= 220:
-            if temp <= 185:
-                memberships['high'] = (temp - 150) / 35
-            else:
-                memberships['high'] = (220 - temp) / 35
-        
-        # Critical: 200°F+
-        if temp >= 200:
-            memberships['critical'] = min(1, (temp - 200) / 100)
-        
-        return memberships
+        out = self._heat_buf if np.ndim(temp) == 0 else None
+        temp = np.clip(temp, *self.heat_range)
+        return self._triangular_membership(temp, self.heat_a, self.heat_b, self.heat_c, out)
     
     def get_duration_membership(self, duration):
         """
         Calculate membership values for duration fuzzy sets
         
         Args:
-            duration (float): Duration in seconds
+            duration (float or ndarray): Duration in seconds
             
         Returns:
-            dict: Membership values for each duration category
+            ndarray: Membership values ordered as DURATION_NAMES
+                     (short: 0-15s, medium: 10-35s, long: 25s+).
+                     For scalar input this is a shared buffer that the
+                     next scalar call overwrites.
         """
-        memberships = {
-            'short': 0,
-            'medium': 0,
-            'long': 0
-        }
-        
-        # Short: 0-15s
-        if duration <= 15:
-            memberships['short'] = max(0, (15 - duration) / 15)
-        
-        # Medium: 10-35s
-        if 10 <= duration <= 35:
-            if duration <= 22.5:
-                memberships['medium'] = (duration - 10) / 12.5
-            else:
-                memberships['medium'] = (35 - duration) / 12.5
-        
-        # Long: 25s+
-        if duration >= 25:
-            memberships['long'] = min(1, (duration - 25) / 35)
-        
-        return memberships
+        out = self._dur_buf if np.ndim(duration) == 0 else None
+        duration = np.clip(duration, *self.duration_range)
+        return self._triangular_membership(
+            duration, self.duration_a, self.duration_b, self.duration_c, out
+        )
     
     def get_fuzzy_output(self, heat_memberships, duration_memberships):
         """
         Apply fuzzy rules and calculate defuzzified output
         
         Args:
-            heat_memberships (dict): Heat level membership values
-            duration_memberships (dict): Duration membership values
+            heat_memberships (ndarray): Heat level membership values
+            duration_memberships (ndarray): Duration membership values
             
         Returns:
             float: Defuzzified water output value (0-1)
         """
-        rules = [
-            # Rule 1: Low heat, any duration = No water
-            {'heat': 'low', 'duration': 'short', 'output': 0},
-            {'heat': 'low', 'duration': 'medium', 'output': 0},
-            {'heat': 'low', 'duration': 'long', 'output': 0},
-            
-            # Rule 2: Medium heat, short duration = Low water
-            {'heat': 'medium', 'duration': 'short', 'output': 0.2},
-            {'heat': 'medium', 'duration': 'medium', 'output': 0.4},
-            {'heat': 'medium', 'duration': 'long', 'output': 0.6},
-            
-            # Rule 3: High heat = Medium to high water
-            {'heat': 'high', 'duration': 'short', 'output': 0.6},
-            {'heat': 'high', 'duration': 'medium', 'output': 0.8},
-            {'heat': 'high', 'duration': 'long', 'output': 1.0},
-            
-            # Rule 4: Critical heat = Maximum water
-            {'heat': 'critical', 'duration': 'short', 'output': 0.8},
-            {'heat': 'critical', 'duration': 'medium', 'output': 1.0},
-            {'heat': 'critical', 'duration': 'long', 'output': 1.0}
-        ]
-        
-        numerator = 0
-        denominator = 0
-        
-        for rule in rules:
-            strength = min(
-                heat_memberships[rule['heat']],
-                duration_memberships[rule['duration']]
-            )
-            
-            numerator += strength * rule['output']
-            denominator += strength
+        strengths = np.minimum(heat_memberships[self.rule_heat],
+                               duration_memberships[self.rule_dur])
+        denominator = strengths.sum()
         
-        return numerator / denominator if denominator > 0 else 0
+        if denominator > 0:
+            return float((strengths * self.rule_out).sum() / denominator)
+        return 0.0
     
-    def get_dominant_membership(self, memberships):
+    def get_dominant_membership(self, memberships, names):
         """
         Get the fuzzy set with highest membership value
         
         Args:
-            memberships (dict): Membership values
+            memberships (ndarray): Membership values
+            names (tuple): Fuzzy set names, in the same order as memberships
             
         Returns:
-            str: Name of dominant fuzzy set
+            str: Name of dominant fuzzy set (the first one on ties)
         """
-        max_value = 0
-        dominant = ''
-        
-        for key, value in memberships.items():
-            if value > max_value:
-                max_value = value
-                dominant = key
-        
-        return dominant if dominant else list(memberships.keys())[0]
+        return names[int(np.argmax(memberships))]
     
     def calculate_system_response(self, heat_level, duration):
         """
@@ -160,13 +223,49 @@ class FuzzyLogicController:
         Returns:
             dict: Complete system response with all calculated values
         """
-        heat_memberships = self.get_heat_membership(heat_level)
-        duration_memberships = self.get_duration_membership(duration)
-        water_output = self.get_fuzzy_output(heat_memberships, duration_memberships)
+        # Quantize to 0.1 so slider jitter maps onto cached responses
+        (heat_memberships, duration_memberships, water_output,
+         dominant_heat, dominant_duration, should_trigger, spray_duration,
+         system_status, status_color, water_level, water_pressure) = self._cached_response(
+            round(float(heat_level), 1), round(float(duration), 1)
+        )
+        
+        return {
+            'heat_memberships': dict(zip(self.HEAT_NAMES, heat_memberships)),
+            'duration_memberships': dict(zip(self.DURATION_NAMES, duration_memberships)),
+            'water_output': water_output,
+            'dominant_heat': dominant_heat,
+            'dominant_duration': dominant_duration,
+            'should_trigger': should_trigger,
+            'spray_duration': spray_duration,
+            'system_status': system_status,
+            'status_color': status_color,
+            'water_level': water_level,
+            'water_pressure': water_pressure
+        }
+    
+    def _compute_response(self, heat_level, duration):
+        """
+        Evaluate the full system response for one input pair
+        
+        Args:
+            heat_level (float): Temperature in Fahrenheit
+            duration (float): Duration in seconds
+            
+        Returns:
+            tuple: Immutable response values, in calculate_system_response key order
+        """
+        water_output, heat_idx, dur_idx, heat_memberships, duration_memberships = _fuzzy_eval(
+            float(heat_level), float(duration),
+            self.heat_range, self.heat_a, self.heat_b, self.heat_c,
+            self.duration_range, self.duration_a, self.duration_b, self.duration_c,
+            self.rule_heat, self.rule_dur, self.rule_out,
+            self._heat_buf, self._dur_buf
+        )
         
         # Determine dominant fuzzy sets
-        dominant_heat = self.get_dominant_membership(heat_memberships)
-        dominant_duration = self.get_dominant_membership(duration_memberships)
+        dominant_heat = self.HEAT_NAMES[heat_idx]
+        dominant_duration = self.DURATION_NAMES[dur_idx]
         
         # Determine if sprinkler should trigger (155°F-165°F threshold)
         should_trigger = heat_level >= 155 and duration > 0
@@ -178,37 +277,87 @@ class FuzzyLogicController:
         spray_duration = base_duration * heat_multiplier * output_multiplier
         
         # Determine system status
-        if should_trigger:
-            system_status = 'ACTIVE'
-            status_color = '#ff4444'
-        elif heat_level >= 140:
-            system_status = 'WARNING'
-            status_color = '#ffa726'
-        else:
-            system_status = 'STANDBY'
-            status_color = '#4ecdc4'
+        status_idx = max(2 * should_trigger, heat_level >= 140)
+        system_status, status_color = self.STATUS_TABLE[status_idx]
         
         # Determine water output level
-        if water_output > 0:
-            if water_output < 0.3:
-                water_level = 'Low'
-            elif water_output < 0.7:
-                water_level = 'Medium'
-            else:
-                water_level = 'High'
-        else:
-            water_level = 'None'
+        level_idx = (water_output > 0) * (
+            1 + bisect.bisect_right(self.WATER_LEVEL_THRESHOLDS, water_output)
+        )
+        water_level = self.WATER_LEVELS[level_idx]
+        
+        return (
+            tuple(heat_memberships.tolist()),
+            tuple(duration_memberships.tolist()),
+            water_output,
+            dominant_heat.capitalize(),
+            dominant_duration.capitalize(),
+            should_trigger,
+            int(spray_duration),
+            system_status,
+            status_color,
+            water_level,
+            int(water_output * 100)
+        )
+    
+    def calculate_system_response_batch(self, heat_levels, durations):
+        """
+        Vectorized system response over many input pairs, for analysis sweeps
+        
+        Inputs are broadcast against each other and evaluated without
+        quantization, so results match the unrounded scalar evaluation.
+        
+        Args:
+            heat_levels (array-like): Temperatures in Fahrenheit
+            durations (array-like): Durations in seconds
+            
+        Returns:
+            dict: Same keys as calculate_system_response, each holding an
+                  array with one entry (or row of memberships) per input pair
+        """
+        heat_levels, durations = np.broadcast_arrays(
+            np.asarray(heat_levels, dtype=np.float64).ravel(),
+            np.asarray(durations, dtype=np.float64).ravel()
+        )
+        
+        # (N, 4) and (N, 3) membership matrices
+        heat_memberships = self.get_heat_membership(heat_levels)
+        duration_memberships = self.get_duration_membership(durations)
+        
+        # (N, 12) rule strength matrix and centroid defuzzification per row
+        strengths = np.minimum(heat_memberships[:, self.rule_heat],
+                               duration_memberships[:, self.rule_dur])
+        numerator = (strengths * self.rule_out).sum(axis=1)
+        denominator = strengths.sum(axis=1)
+        water_output = np.divide(numerator, denominator,
+                                 out=np.zeros_like(numerator), where=denominator > 0)
+        
+        heat_labels = np.array([name.capitalize() for name in self.HEAT_NAMES])
+        duration_labels = np.array([name.capitalize() for name in self.DURATION_NAMES])
+        
+        should_trigger = (heat_levels >= 155) & (durations > 0)
+        
+        heat_multiplier = np.maximum(1, (heat_levels - 155) / 50)
+        output_multiplier = np.maximum(0.5, water_output)
+        spray_duration = 5000 * heat_multiplier * output_multiplier
+        
+        status_names, status_colors = (np.array(column) for column in zip(*self.STATUS_TABLE))
+        status_idx = np.maximum(2 * should_trigger, heat_levels >= 140)
+        
+        level_idx = (water_output > 0) * (
+            1 + np.searchsorted(self.WATER_LEVEL_THRESHOLDS, water_output, side='right')
+        )
         
         return {
             'heat_memberships': heat_memberships,
             'duration_memberships': duration_memberships,
             'water_output': water_output,
-            'dominant_heat': dominant_heat.capitalize(),
-            'dominant_duration': dominant_duration.capitalize(),
+            'dominant_heat': heat_labels[np.argmax(heat_memberships, axis=1)],
+            'dominant_duration': duration_labels[np.argmax(duration_memberships, axis=1)],
             'should_trigger': should_trigger,
-            'spray_duration': int(spray_duration),
-            'system_status': system_status,
-            'status_color': status_color,
-            'water_level': water_level,
-            'water_pressure': int(water_output * 100)
+            'spray_duration': spray_duration.astype(int),
+            'system_status': status_names[status_idx],
+            'status_color': status_colors[status_idx],
+            'water_level': np.array(self.WATER_LEVELS)[level_idx],
+            'water_pressure': (water_output * 100).astype(int)
         }
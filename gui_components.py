@@ -6,7 +6,7 @@ Contains all Tkinter interface elements and visual components
 import tkinter as tk
 from tkinter import ttk
 import math
-from PIL import Image, ImageTk
+from PIL import Image, ImageDraw, ImageTk
 from fuzzy_logic_controller import FuzzyLogicController
 
 
@@ -25,7 +25,26 @@ class FireSuppressionGUI:
         self.heat_level = tk.DoubleVar(value=70)
         self.is_triggered = False
         self.water_drops = []
+        self._spray_frames = []
+        self._spray_frames_key = None
+        self._spray_frame_idx = 0
+        self._spray_offset = (0, 0)
+        self._water_item = None
+        self._fire_item = None
+        self._sprink_ids = {}
+        self._fire_img_cache = {}
+        self._bg_finalize = None
+        # Canvas size as last reported by <Configure>, read by the animators
+        self._cw, self._ch = 400, 600
         self.animation_running = False
+        self._pending_update = None
+        
+        # Decode the background once; resize events only rescale this copy
+        try:
+            with Image.open("Images/background.jpg") as bg_image:
+                self._bg_orig = bg_image.copy()
+        except Exception:
+            self._bg_orig = None
         
         # Setup the user interface
         self.setup_ui()
@@ -125,19 +144,33 @@ class FireSuppressionGUI:
 
     def on_canvas_resize(self, event):
         """Handle canvas resize and redraw background image"""
-        self.load_background_image(event.width, event.height)
+        self._cw, self._ch = event.width, event.height
+        # Use a cheap filter while the window is being dragged, then redo the
+        # background in full quality once resize events stop arriving
+        self.load_background_image(event.width, event.height, Image.Resampling.BILINEAR)
+        if self._bg_finalize:
+            self.root.after_cancel(self._bg_finalize)
+        self._bg_finalize = self.root.after(
+            150, self._finalize_background, event.width, event.height
+        )
         self.draw_sprinkler()
 
-    def load_background_image(self, width=400, height=600):
-        """Load and display background image, scaled to canvas size"""
+    def _finalize_background(self, width, height):
+        """Re-render the background with high-quality resampling after a resize"""
+        self._bg_finalize = None
+        self.load_background_image(width, height, Image.Resampling.LANCZOS)
+
+    def load_background_image(self, width=400, height=600, resample=Image.Resampling.LANCZOS):
+        """Display the cached background image, scaled to canvas size"""
         self.canvas.delete("bg_img")
-        try:
-            bg_image = Image.open("Images/background.jpg")
-            bg_image = bg_image.resize((width, height), Image.Resampling.LANCZOS)
+        if self._bg_orig is not None:
+            bg_image = self._bg_orig.resize((width, height), resample)
             self.bg_photo = ImageTk.PhotoImage(bg_image)
             self.canvas.create_image(width // 2, height // 2, image=self.bg_photo, tags="bg_img")
-        except:
+        else:
             self.canvas.create_rectangle(0, 0, width, height, fill='#1a252f', outline='', tags="bg_img")
+        # Keep persistent water and fire items drawn above the new background
+        self.canvas.tag_lower("bg_img")
 
     def setup_status_panel(self, parent):
         """Setup the right panel with fuzzy logic display"""
@@ -186,57 +219,93 @@ class FireSuppressionGUI:
         self.heat_membership_frame = tk.Frame(parent, bg='#34495e')
         self.heat_membership_frame.pack(fill=tk.X, padx=10, pady=5)
         
+        tk.Label(self.heat_membership_frame, text="Heat:", 
+                font=('Arial', 10, 'bold'), fg='#ecf0f1', bg='#34495e').pack(anchor=tk.W)
+        
+        # Labels are created once and only have their text updated
+        self._heat_mu_labels = {}
+        for key in self.fuzzy_controller.HEAT_NAMES:
+            label = tk.Label(self.heat_membership_frame, text="", 
+                            font=('Arial', 9), fg='#bdc3c7', bg='#34495e')
+            label.pack(anchor=tk.W)
+            self._heat_mu_labels[key] = label
+        
+    def _build_spray_frames(self, splash_length):
+        """Pre-render every frame of the water splash cycle for a given spray length"""
+        num_drops = 40
+        spread_angle = math.radians(120)
+        base_angle = math.pi / 2
+        speed = 0.22
+        max_radius = 17
+
+        # Drop angles never change, so their direction vectors are tabulated once
+        angles = [base_angle - spread_angle / 2 + (spread_angle * i / (num_drops - 1))
+                  for i in range(num_drops)]
+        drop_cos = [math.cos(angle) for angle in angles]
+        drop_sin = [math.sin(angle) for angle in angles]
+
+        # All drops advance in lockstep and wrap back to 0 once past 1, so the
+        # splash repeats every ceil(1 / speed) frames
+        num_frames = math.ceil(1 / speed)
+        half_width = int(splash_length * max(map(abs, drop_cos))) + max_radius + 1
+        size = (2 * half_width, splash_length + 2 * max_radius + 1)
+
+        self._spray_frames = []
+        for k in range(num_frames):
+            progress = k * speed
+            length = splash_length * progress
+            drop_radius = 7 + 10 * progress
+
+            # Each frame is rasterized offscreen and shown through one canvas image
+            frame = Image.new('RGBA', size)
+            draw = ImageDraw.Draw(frame)
+            for cos_a, sin_a in zip(drop_cos, drop_sin):
+                x = half_width + length * cos_a
+                y = max_radius + length * sin_a
+                draw.ellipse(
+                    (x - drop_radius, y - drop_radius,
+                     x + drop_radius, y + drop_radius),
+                    fill='#3498db', outline='#2980b9'
+                )
+            self._spray_frames.append(ImageTk.PhotoImage(frame))
+        self._spray_offset = (half_width, max_radius)
+
     def animate_water_spray(self):
         """Animate a very fast, realistic outward water splash from the sprinkler head"""
         if not self.animation_running:
             return
 
-        self.canvas.delete("water")
-
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
+        canvas_width, canvas_height = self._cw, self._ch
         x_center = canvas_width // 2
         y_start = canvas_height // 3 + 55
 
-        num_drops = 40
-        splash_length = canvas_height // 2
-        spread_angle = math.radians(120)
-        base_angle = math.pi / 2
-
-        if not hasattr(self, 'water_splash_drops') or len(self.water_splash_drops) != num_drops:
-            self.water_splash_drops = []
-            for i in range(num_drops):
-                angle = base_angle - spread_angle / 2 + (spread_angle * i / (num_drops - 1))
-                self.water_splash_drops.append({'angle': angle, 'progress': 0})
-
-        speed = 0.22
-        for drop in self.water_splash_drops:
-            drop['progress'] += speed
-            if drop['progress'] > 1:
-                drop['progress'] = 0
-
-            length = splash_length * drop['progress']
-            x = x_center + length * math.cos(drop['angle'])
-            y = y_start + length * math.sin(drop['angle'])
-            drop_radius = 7 + 10 * drop['progress']
+        # Frames only depend on the canvas size; rebuild them after a resize
+        if self._spray_frames_key != (canvas_width, canvas_height):
+            self._build_spray_frames(canvas_height // 2)
+            self._spray_frames_key = (canvas_width, canvas_height)
 
-            self.canvas.create_oval(
-                x - drop_radius, y - drop_radius,
-                x + drop_radius, y + drop_radius,
-                fill='#3498db', outline='#2980b9', tags="water"
+        self._spray_frame_idx = (self._spray_frame_idx + 1) % len(self._spray_frames)
+        frame = self._spray_frames[self._spray_frame_idx]
+        left = x_center - self._spray_offset[0]
+        top = y_start - self._spray_offset[1]
+        if self._water_item is None:
+            self._water_item = self.canvas.create_image(
+                left, top, anchor=tk.NW, image=frame, tags="water"
             )
+        else:
+            self.canvas.coords(self._water_item, left, top)
+            self.canvas.itemconfig(self._water_item, image=frame)
 
         self.root.after(16, self.animate_water_spray)
 
     def animate_fire(self):
         """Show realistic fire image based on heat and timer"""
-        self.canvas.delete("fire")
-
         if not self.is_triggered or not self.fire_img_orig or self.fire_timer <= 0:
+            self.canvas.delete("fire")
+            self._fire_item = None
             return
 
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
+        canvas_width, canvas_height = self._cw, self._ch
         x_center = canvas_width // 2
         y_bottom = canvas_height - 40
 
@@ -246,13 +315,30 @@ class FireSuppressionGUI:
         fire_height = int(fire_height * timer_ratio)
         fire_width = int(fire_height * 0.7)
 
-        fire_img = self.fire_img_orig.resize((fire_width, fire_height), Image.Resampling.LANCZOS)
-        self.fire_img = ImageTk.PhotoImage(fire_img)
-        self.canvas.create_image(x_center, y_bottom - fire_height // 2, image=self.fire_img, tags="fire")
+        # Fire sizes repeat across ticks and runs, so resized frames are cached by size
+        size = (fire_width, fire_height)
+        self.fire_img = self._fire_img_cache.get(size)
+        if self.fire_img is None:
+            fire_img = self.fire_img_orig.resize(size, Image.Resampling.LANCZOS)
+            self.fire_img = ImageTk.PhotoImage(fire_img)
+            self._fire_img_cache[size] = self.fire_img
+        y_center = y_bottom - fire_height // 2
+        if self._fire_item is None:
+            self._fire_item = self.canvas.create_image(x_center, y_center, image=self.fire_img, tags="fire")
+        else:
+            self.canvas.coords(self._fire_item, x_center, y_center)
+            self.canvas.itemconfig(self._fire_item, image=self.fire_img)
 
     def on_heat_change(self, value):
-        """Handle heat level slider change"""
+        """Handle heat level slider change, coalescing rapid drags into one update"""
         self.heat_value_label.config(text=f"{int(float(value))}°F")
+        if self._pending_update:
+            self.root.after_cancel(self._pending_update)
+        self._pending_update = self.root.after(30, self._do_update)
+        
+    def _do_update(self):
+        """Run the deferred system update scheduled by on_heat_change"""
+        self._pending_update = None
         self.update_system()
         
     def update_system(self):
@@ -267,15 +353,15 @@ class FireSuppressionGUI:
         self.update_membership_display(result)
 
     def update_membership_display(self, result):
-        for widget in self.heat_membership_frame.winfo_children():
-            widget.destroy()
-        tk.Label(self.heat_membership_frame, text="Heat:", 
-                font=('Arial', 10, 'bold'), fg='#ecf0f1', bg='#34495e').pack(anchor=tk.W)
+        """Refresh the heat membership labels, blanking negligible values"""
         for key, value in result['heat_memberships'].items():
-            if value > 0.01:
-                text = f"{key.capitalize()}: {value:.2f}"
-                tk.Label(self.heat_membership_frame, text=text, 
-                        font=('Arial', 9), fg='#bdc3c7', bg='#34495e').pack(anchor=tk.W)
+            text = f"{key.capitalize()}: {value:.2f}" if value > 0.01 else ""
+            self._heat_mu_labels[key].config(text=text)
+
+    def clear_water_spray(self):
+        """Remove the water spray item so the next spray recreates it"""
+        self.canvas.delete("water")
+        self._water_item = None
 
     def reset_system(self):
         """Reset the entire system to initial state and unlock inputs"""
@@ -284,33 +370,37 @@ class FireSuppressionGUI:
         self.heat_level.set(70)
         self.heat_scale.config(state=tk.NORMAL)
         self.start_btn.config(state=tk.NORMAL)
-        self.canvas.delete("water")
+        self.clear_water_spray()
         self.draw_sprinkler()
         self.update_system()
         self.animate_fire()
         self.timer_label.config(text="")
 
     def draw_sprinkler(self):
-        """Draw the sprinkler head centered on canvas"""
-        self.canvas.delete("sprinkler")
-        canvas_width = self.canvas.winfo_width()
-        canvas_height = self.canvas.winfo_height()
-        if canvas_width < 1 or canvas_height < 1:
-            canvas_width, canvas_height = 400, 600
-        x = canvas_width // 2
-        y = canvas_height // 3
-        self.canvas.create_oval(x-25, y-40, x+25, y+40, 
-                               fill='#bdc3c7', outline='#7f8c8d', width=2, tags="sprinkler")
+        """Draw the sprinkler head centered on canvas, reusing existing items"""
+        x = self._cw // 2
+        y = self._ch // 3
+        if not self._sprink_ids:
+            self._sprink_ids = {
+                'body': self.canvas.create_oval(0, 0, 0, 0, 
+                                                fill='#bdc3c7', outline='#7f8c8d', width=2, tags="sprinkler"),
+                'bulb': self.canvas.create_oval(0, 0, 0, 0, tags="sprinkler"),
+                'deflector': self.canvas.create_oval(0, 0, 0, 0, 
+                                                     fill='#95a5a6', outline='#7f8c8d', width=2, tags="sprinkler"),
+                'pipe': self.canvas.create_rectangle(0, 0, 0, 0, 
+                                                     fill='#7f8c8d', outline='#34495e', width=2, tags="sprinkler"),
+            }
+        self.canvas.coords(self._sprink_ids['body'], x-25, y-40, x+25, y+40)
+        self.canvas.coords(self._sprink_ids['bulb'], x-8, y+25, x+8, y+40)
+        self.canvas.coords(self._sprink_ids['deflector'], x-20, y+45, x+20, y+55)
+        self.canvas.coords(self._sprink_ids['pipe'], x-15, y-60, x+15, y-40)
+        # Intact glass bulb is red; once triggered only the empty frame remains
         if not self.is_triggered:
-            self.canvas.create_oval(x-8, y+25, x+8, y+40, 
-                                   fill='#e74c3c', outline='#c0392b', width=2, tags="sprinkler")
+            self.canvas.itemconfig(self._sprink_ids['bulb'], 
+                                   fill='#e74c3c', outline='#c0392b', width=2)
         else:
-            self.canvas.create_oval(x-8, y+25, x+8, y+40, 
-                                   fill='', outline='#7f8c8d', width=1, tags="sprinkler")
-        self.canvas.create_oval(x-20, y+45, x+20, y+55, 
-                               fill='#95a5a6', outline='#7f8c8d', width=2, tags="sprinkler")
-        self.canvas.create_rectangle(x-15, y-60, x+15, y-40, 
-                                    fill='#7f8c8d', outline='#34495e', width=2, tags="sprinkler")
+            self.canvas.itemconfig(self._sprink_ids['bulb'], 
+                                   fill='', outline='#7f8c8d', width=1)
 
     def start_fire(self):
         """Start the fire demo with selected heat, disable slider and button, and start timer"""
@@ -326,6 +416,7 @@ class FireSuppressionGUI:
         # Only activate sprinkler if heat is above threshold
         if self.initial_heat >= 155:
             self.animation_running = True
+            self._spray_frame_idx = 0
             self.timer_label.config(
                 text=f"Fire will be extinguished in {self.fire_timer}s (Total: {self.total_fire_time}s)"
             )
@@ -335,7 +426,7 @@ class FireSuppressionGUI:
             self.timer_label.config(
                 text=f"Fire is too small for sprinkler activation.\nFire will be extinguished in {self.fire_timer}s (Total: {self.total_fire_time}s)"
             )
-            self.canvas.delete("water")
+            self.clear_water_spray()
 
         self.draw_sprinkler()
         self.animate_fire()